@@ -1,6 +1,22 @@
+import contextlib
 import datetime
+import sys
+from bisect import bisect_left
 from enum import Enum
-from typing import List, Dict, Optional
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Bound once at import so hot paths skip the datetime.datetime attribute chain
+_now = datetime.datetime.now
+_strptime = datetime.datetime.strptime
+
+
+@lru_cache(maxsize=1024)
+def _parse_dt(datetime_str: str) -> datetime.datetime:
+    """Parse a 'YYYY-MM-DD HH:MM' string, caching results for repeated inputs."""
+    return _strptime(datetime_str, '%Y-%m-%d %H:%M')
 
 
 class RentalBasis(Enum):
@@ -10,9 +26,56 @@ class RentalBasis(Enum):
     WEEKLY = 3
 
 
+# Billing unit, Car price getter and unit label, indexed by RentalBasis.value - 1
+_BASIS_TABLE = (
+    (datetime.timedelta(hours=1), attrgetter('price_hourly_cents'), "hour(s)"),
+    (datetime.timedelta(days=1), attrgetter('price_daily_cents'), "day(s)"),
+    (datetime.timedelta(weeks=1), attrgetter('price_weekly_cents'), "week(s)"),
+)
+
+# Size, model and rates of the default fleet created by CarRentalSystem
+_DEFAULT_FLEET_SIZE = 50
+_DEFAULT_MODEL = "Maruti Suzuki Baleno"
+_DEFAULT_HOURLY = 200.0
+_DEFAULT_DAILY = 1000.0
+_DEFAULT_WEEKLY = 4750.0
+
+# Bound ID formatters for generated car, customer, rental and bill IDs
+_CAR_FMT = "BAL{:03d}".format
+_CUST_FMT = "CUST{:04d}".format
+_RENTAL_FMT = "R{:04d}".format
+_BILL_FMT = "B{:04d}".format
+
+_INVOICE_HEADER = """
+        ======= INVOICE =======
+        Bill ID: {bill_id}
+        Customer: {customer}
+        
+        Rental Details:
+        - Rental ID: {rental_id}
+        - Rental Basis: {basis}
+        - Duration: {units} {unit_label}
+        - Start Time: {start}
+        - End Time: {end}
+        
+        Cars Rented:"""
+
+_INVOICE_FOOTER = """
+        Total Amount: Rs{amount:.2f}
+        Status: {status}
+        
+        Generated on: {generated}
+        =======================
+        """
+
+
 class Car:
     """Class representing a car in the rental system."""
     
+    __slots__ = ('car_id', 'model', 'price_hourly', 'price_daily', 'price_weekly',
+                 '_available', '_on_availability', 'rental_start_time', 'rental_basis',
+                 '_rate_prices', '_rate_line')
+    
     def __init__(self, car_id: str, model: str, price_hourly: float, price_daily: float, price_weekly: float):
         """Initialize a new Car object.
         
@@ -28,19 +91,67 @@ class Car:
         self.price_hourly = price_hourly
         self.price_daily = price_daily
         self.price_weekly = price_weekly
-        self.available = True
+        self._rate_prices = None
+        self._rate_line = None
+        self._available = True
+        self._on_availability = None
         self.rental_start_time = None
         self.rental_basis = None
     
+    @property
+    def available(self) -> bool:
+        """Whether the car can be rented."""
+        return self._available
+    
+    @available.setter
+    def available(self, available: bool):
+        # Notify the owning CarRentalSystem so its available-cars index stays in step
+        if available != self._available:
+            self._available = available
+            if self._on_availability is not None:
+                self._on_availability(self)
+    
+    # Integer cents keep bill totals exact; derived from price_* so they never go stale
+    @property
+    def price_hourly_cents(self) -> int:
+        """Hourly rental price in integer cents."""
+        return round(self.price_hourly * 100)
+    
+    @property
+    def price_daily_cents(self) -> int:
+        """Daily rental price in integer cents."""
+        return round(self.price_daily * 100)
+    
+    @property
+    def price_weekly_cents(self) -> int:
+        """Weekly rental price in integer cents."""
+        return round(self.price_weekly * 100)
+    
+    @property
+    def rate_line(self) -> str:
+        """Rate line for display, reformatted only when a price changes."""
+        prices = (self.price_hourly, self.price_daily, self.price_weekly)
+        if prices != self._rate_prices:
+            self._rate_prices = prices
+            self._rate_line = (f"   Hourly Rate: Rs{prices[0]:.2f} | Daily Rate: Rs{prices[1]:.2f}"
+                               f" | Weekly Rate: Rs{prices[2]:.2f}")
+        return self._rate_line
+    
     def __str__(self) -> str:
         """Return string representation of the car."""
         status = "Available" if self.available else "Not Available"
         return f"Car ID: {self.car_id} | Model: {self.model} | Status: {status}"
+    
+    def __repr__(self) -> str:
+        """Return debug representation of the car."""
+        return f"<Car {self.car_id} {self.model}>"
 
 
 class Customer:
     """Class representing a customer in the rental system."""
     
+    __slots__ = ('customer_id', 'name', 'email', 'phone', 'rented_cars', 'rental_history')
+    
     def __init__(self, customer_id: str, name: str, email: str, phone: str):
         """Initialize a new Customer object.
         
@@ -54,7 +165,7 @@ class Customer:
         self.name = name
         self.email = email
         self.phone = phone
-        self.rented_cars = []
+        self.rented_cars: Dict[str, Car] = {}
         self.rental_history = []
     
     def __str__(self) -> str:
@@ -63,10 +174,19 @@ class Customer:
 
 
 class Rental:
-    """Class representing a rental transaction."""
+    """Class representing a rental transaction.
+    
+    The rate is the sum of the car prices for the rental basis when the rental
+    is created. It is locked for the life of the rental, so a later change to a
+    car's price applies only to rentals opened after it.
+    """
+    
+    __slots__ = ('rental_id', 'customer', 'cars', 'rental_basis', 'start_time', 'end_time',
+                 'bill_amount', 'duration_units', 'unit_str', '_rate_cents', '_unit', '_billed_until',
+                 '_start_time_str', '_end_time_str')
     
     def __init__(self, rental_id: str, customer: Customer, cars: List[Car], rental_basis: RentalBasis, 
-                 start_time: datetime.datetime):
+                 start_time: Optional[datetime.datetime] = None):
         """Initialize a new Rental object.
         
         Args:
@@ -74,48 +194,88 @@ class Rental:
             customer: Customer who is renting
             cars: List of cars being rented
             rental_basis: Basis of rental (hourly, daily, weekly)
-            start_time: Start time of the rental
+            start_time: Start time of the rental. Defaults to current time.
         """
         self.rental_id = rental_id
         self.customer = customer
         self.cars = cars
         self.rental_basis = rental_basis
-        self.start_time = start_time
+        self.start_time = start_time or _now()
         self.end_time = None
         self.bill_amount = 0.0
+        self.duration_units = 0
+        self._billed_until = None
+        self._start_time_str = None
+        self._end_time_str = None
+        
+        # Resolve the basis row and lock the summed rate; the basis is fixed for the life of the rental
+        self._unit, get_price, self.unit_str = _BASIS_TABLE[rental_basis.value - 1]
+        self._rate_cents = sum(map(get_price, cars))
     
-    def calculate_bill(self, return_time: datetime.datetime = None) -> float:
-        """Calculate the bill amount based on rental duration and basis.
+    @property
+    def start_time_str(self) -> str:
+        """Start time formatted for display, cached after first use."""
+        if self._start_time_str is None:
+            self._start_time_str = self.start_time.isoformat(sep=' ', timespec='seconds')
+        return self._start_time_str
+    
+    @property
+    def end_time_str(self) -> Optional[str]:
+        """End time formatted for display, cached after first use; None while active."""
+        if self.end_time is None:
+            return None
+        if self._end_time_str is None:
+            self._end_time_str = self.end_time.isoformat(sep=' ', timespec='seconds')
+        return self._end_time_str
+    
+    def billable_units(self, end_time: datetime.datetime) -> int:
+        """Return the number of whole billing units from the start time to end_time.
         
         Args:
-            return_time: Optional time when cars were returned. Defaults to current time.
+            end_time: Time up to which the rental is billed
         
         Returns:
-            float: The calculated bill amount
+            int: Number of hours, days or weeks to charge, at least 1
         """
-        if return_time:
-            self.end_time = return_time
-        elif not self.end_time:
-            self.end_time = datetime.datetime.now()
+        return max(1, (end_time - self.start_time) // self._unit)
+    
+    def quote(self, as_of: datetime.datetime) -> float:
+        """Return the bill amount as if the rental were returned at as_of.
         
-        rental_duration = self.end_time - self.start_time
+        Does not close the rental or change its stored bill.
         
-        if self.rental_basis == RentalBasis.HOURLY:
-            hours = max(1, int(rental_duration.total_seconds() / 3600))
-            self.bill_amount = sum(car.price_hourly * hours for car in self.cars)
-            duration_str = f"{hours} hour(s)"
+        Args:
+            as_of: Time up to which the rental is billed
         
-        elif self.rental_basis == RentalBasis.DAILY:
-            days = max(1, int(rental_duration.total_seconds() / (24 * 3600)))
-            self.bill_amount = sum(car.price_daily * days for car in self.cars)
-            duration_str = f"{days} day(s)"
+        Returns:
+            float: The bill amount at as_of
+        """
+        return self._rate_cents * self.billable_units(as_of) / 100
+    
+    def calculate_bill(self, return_time: datetime.datetime = None) -> float:
+        """Calculate the bill amount based on rental duration and basis.
         
-        elif self.rental_basis == RentalBasis.WEEKLY:
-            weeks = max(1, int(rental_duration.total_seconds() / (7 * 24 * 3600)))
-            self.bill_amount = sum(car.price_weekly * weeks for car in self.cars)
-            duration_str = f"{weeks} week(s)"
+        Does not close the rental; only CarRentalSystem.return_cars does that. The
+        result is cached for the time it was billed up to. Once the rental is
+        returned, billing to any other time is only quoted, so the final bill
+        stays in bill_amount.
         
-        print(f"Rental duration: {duration_str}")
+        Args:
+            return_time: Optional time up to which to bill. Defaults to the rental's
+                end time, or the current time for an active rental.
+        
+        Returns:
+            float: The calculated bill amount
+        """
+        billed_until = return_time or self.end_time or _now()
+        if billed_until == self._billed_until:
+            return self.bill_amount
+        if self.end_time is not None and billed_until != self.end_time:
+            return self.quote(billed_until)
+        
+        self.duration_units = self.billable_units(billed_until)
+        self.bill_amount = self.quote(billed_until)
+        self._billed_until = billed_until
         
         return self.bill_amount
 
@@ -123,17 +283,24 @@ class Rental:
 class Bill:
     """Class representing a bill for a rental."""
     
-    def __init__(self, bill_id: str, rental: Rental):
+    __slots__ = ('bill_id', 'rental', 'amount', 'billed_until', 'duration_units', 'generated_time', 'paid')
+    
+    def __init__(self, bill_id: str, rental: Rental, generated_time: Optional[datetime.datetime] = None):
         """Initialize a new Bill object.
         
         Args:
             bill_id: Unique identifier for the bill
             rental: Rental associated with the bill
+            generated_time: Time the bill is generated. Defaults to current time.
+                An active rental is billed up to this time without being closed.
         """
         self.bill_id = bill_id
         self.rental = rental
-        self.amount = rental.calculate_bill()
-        self.generated_time = datetime.datetime.now()
+        self.generated_time = generated_time or _now()
+        # Frozen on the bill so a later return does not change an interim invoice
+        self.billed_until = rental.end_time or self.generated_time
+        self.amount = rental.calculate_bill(self.billed_until)
+        self.duration_units = rental.billable_units(self.billed_until)
         self.paid = False
     
     def mark_as_paid(self):
@@ -142,62 +309,55 @@ class Bill:
     
     def generate_invoice(self) -> str:
         """Generate a readable invoice."""
-        rental_basis_str = self.rental.rental_basis.name.lower()
-        duration = (self.rental.end_time - self.rental.start_time).total_seconds()
-        
-        if self.rental.rental_basis == RentalBasis.HOURLY:
-            duration_units = max(1, int(duration / 3600))
-            unit_str = "hour(s)"
-        elif self.rental.rental_basis == RentalBasis.DAILY:
-            duration_units = max(1, int(duration / (24 * 3600)))
-            unit_str = "day(s)"
+        rental = self.rental
+        generated = self.generated_time.isoformat(sep=' ', timespec='seconds')
+        if self.billed_until == rental.end_time:
+            end = rental.end_time_str
         else:
-            duration_units = max(1, int(duration / (7 * 24 * 3600)))
-            unit_str = "week(s)"
-        
-        invoice = f"""
-        ======= INVOICE =======
-        Bill ID: {self.bill_id}
-        Customer: {self.rental.customer.name}
-        
-        Rental Details:
-        - Rental ID: {self.rental.rental_id}
-        - Rental Basis: {rental_basis_str}
-        - Duration: {duration_units} {unit_str}
-        - Start Time: {self.rental.start_time.strftime('%Y-%m-%d %H:%M:%S')}
-        - End Time: {self.rental.end_time.strftime('%Y-%m-%d %H:%M:%S')}
-        
-        Cars Rented:
-        """
-        
-        for car in self.rental.cars:
-            invoice += f"- Car ID: {car.car_id} | Model: {car.model}\n"
-        
-        invoice += f"""
-        Total Amount: Rs{self.amount:.2f}
-        Status: {"Paid" if self.paid else "Unpaid"}
-        
-        Generated on: {self.generated_time.strftime('%Y-%m-%d %H:%M:%S')}
-        =======================
-        """
-        
-        return invoice
+            end = self.billed_until.isoformat(sep=' ', timespec='seconds')
+        parts = [_INVOICE_HEADER.format(
+            bill_id=self.bill_id,
+            customer=rental.customer.name,
+            rental_id=rental.rental_id,
+            basis=rental.rental_basis.name.lower(),
+            units=self.duration_units,
+            unit_label=rental.unit_str,
+            start=rental.start_time_str,
+            end=end,
+        )]
+        parts.extend(f"        - Car ID: {car.car_id} | Model: {car.model}" for car in rental.cars)
+        parts.append(_INVOICE_FOOTER.format(
+            amount=self.amount,
+            status="Paid" if self.paid else "Unpaid",
+            generated=generated,
+        ))
+        
+        return "\n".join(parts)
 
 
 class CarRentalSystem:
     """Main class for the car rental system."""
     
-    def __init__(self, company_name: str):
+    def __init__(self, company_name: str, verbose: bool = True):
         """Initialize a new CarRentalSystem.
         
         Args:
             company_name: Name of the car rental company
+            verbose: Whether operations print status messages to stdout
         """
         self.company_name = company_name
+        self.verbose = verbose
         self.inventory: Dict[str, Car] = {}
         self.customers: Dict[str, Customer] = {}
         self.rentals: Dict[str, Rental] = {}
         self.bills: Dict[str, Bill] = {}
+        # Rentals not yet returned, kept in step with rent_cars/return_cars
+        self._active_rentals: Dict[str, Rental] = {}
+        # Cars in inventory order, each car's position in it, and the sorted
+        # positions of available cars, kept in step through Car.available
+        self._fleet: List[Car] = []
+        self._positions: Dict[str, int] = {}
+        self._available_positions: List[int] = []
         self.customer_counter = 0
         self.rental_counter = 0
         self.bill_counter = 0
@@ -205,14 +365,41 @@ class CarRentalSystem:
         # Initialize with 50 Maruti Suzuki Baleno cars
         self._initialize_inventory()
     
+    @contextlib.contextmanager
+    def _quiet(self):
+        """Temporarily disable status messages, e.g. around batch operations."""
+        verbose, self.verbose = self.verbose, False
+        try:
+            yield
+        finally:
+            self.verbose = verbose
+    
     def _initialize_inventory(self):
         """Initialize the inventory with 50 Maruti Suzuki Baleno cars."""
-        for i in range(1, 51):
-            car_id = f"BAL{i:03d}"
-            car = Car(car_id, "Maruti Suzuki Baleno", 200.0, 1000.0, 4750.0)
-            self.inventory[car_id] = car
+        for car_id in map(_CAR_FMT, range(1, _DEFAULT_FLEET_SIZE + 1)):
+            self._add_to_inventory(Car(car_id, _DEFAULT_MODEL, _DEFAULT_HOURLY, _DEFAULT_DAILY, _DEFAULT_WEEKLY))
         
-        print(f"Inventory initialized with 50 Maruti Suzuki Baleno cars.")
+        if self.verbose:
+            print(f"Inventory initialized with {_DEFAULT_FLEET_SIZE} {_DEFAULT_MODEL} cars.")
+    
+    def _add_to_inventory(self, car: Car):
+        """Add a car to the inventory and the available-cars index."""
+        position = len(self._fleet)
+        self.inventory[car.car_id] = car
+        self._fleet.append(car)
+        self._positions[car.car_id] = position
+        car._on_availability = self._availability_changed
+        if car.available:
+            self._available_positions.append(position)
+    
+    def _availability_changed(self, car: Car):
+        """Insert or remove a car's position in the available-cars index."""
+        position = self._positions[car.car_id]
+        index = bisect_left(self._available_positions, position)
+        if car.available:
+            self._available_positions.insert(index, position)
+        else:
+            del self._available_positions[index]
     
     def add_car(self, car: Car) -> bool:
         """Add a car to the inventory.
@@ -224,13 +411,27 @@ class CarRentalSystem:
             bool: True if addition successful, False otherwise
         """
         if car.car_id in self.inventory:
-            print(f"Car with ID {car.car_id} already exists in inventory.")
+            if self.verbose:
+                print(f"Car with ID {car.car_id} already exists in inventory.")
             return False
         
-        self.inventory[car.car_id] = car
-        print(f"Car with ID {car.car_id} added to inventory successfully.")
+        self._add_to_inventory(car)
+        if self.verbose:
+            print(f"Car with ID {car.car_id} added to inventory successfully.")
         return True
     
+    def add_cars(self, cars: Iterable[Car]) -> List[str]:
+        """Add several cars to the inventory without printing per-car messages.
+        
+        Args:
+            cars: Car objects to add
+            
+        Returns:
+            List[str]: IDs of cars skipped because they already exist
+        """
+        with self._quiet():
+            return [car.car_id for car in cars if not self.add_car(car)]
+    
     def register_customer(self, name: str, email: str, phone: str) -> Customer:
         """Register a new customer.
         
@@ -243,35 +444,71 @@ class CarRentalSystem:
             Customer: The newly registered customer
         """
         self.customer_counter += 1
-        customer_id = f"CUST{self.customer_counter:04d}"
+        customer_id = _CUST_FMT(self.customer_counter)
         
         customer = Customer(customer_id, name, email, phone)
         self.customers[customer_id] = customer
         
-        print(f"\nCustomer registered successfully.")
-        print(f"Customer ID: {customer_id}")
-        print(f"Name: {name}")
+        if self.verbose:
+            print(f"\nCustomer registered successfully.")
+            print(f"Customer ID: {customer_id}")
+            print(f"Name: {name}")
         
         return customer
     
+    def add_customers(self, customers: Iterable[Tuple[str, str, str]]) -> List[Customer]:
+        """Register several customers without printing per-customer messages.
+        
+        Args:
+            customers: (name, email, phone) tuples to register
+            
+        Returns:
+            List[Customer]: The newly registered customers
+        """
+        with self._quiet():
+            return [self.register_customer(name, email, phone) for name, email, phone in customers]
+    
+    def iter_available_cars(self) -> Iterator[Car]:
+        """Iterate over available cars in inventory order without printing.
+        
+        Reads the available-cars index instead of scanning the inventory, and
+        iterates over a snapshot, so cars may be rented inside the loop.
+        
+        Yields:
+            Car: Each car currently available for rent
+        """
+        fleet = self._fleet
+        for position in tuple(self._available_positions):
+            yield fleet[position]
+    
+    def iter_active_rentals(self) -> Iterator[Rental]:
+        """Iterate over rentals that have not been returned, without printing.
+        
+        Iterates over a snapshot, so rentals may be returned inside the loop.
+        
+        Yields:
+            Rental: Each active rental
+        """
+        yield from tuple(self._active_rentals.values())
+    
     def display_available_cars(self) -> List[Car]:
         """Display all available cars.
         
         Returns:
             List[Car]: List of available cars
         """
-        available_cars = [car for car in self.inventory.values() if car.available]
+        available_cars = list(self.iter_available_cars())
         
         if not available_cars:
             print("No cars are currently available for rent.")
             return []
         
-        print(f"\nAvailable Cars ({len(available_cars)}):")
-        print("=" * 50)
+        parts = [f"\nAvailable Cars ({len(available_cars)}):", "=" * 50]
         for car in available_cars:
-            print(f"{car}")
-            print(f"   Hourly Rate: Rs{car.price_hourly:.2f} | Daily Rate: Rs{car.price_daily:.2f} | Weekly Rate: Rs{car.price_weekly:.2f}")
-        print("=" * 50)
+            parts.append(str(car))
+            parts.append(car.rate_line)
+        parts.append("=" * 50)
+        sys.stdout.write("\n".join(parts) + "\n")
         
         return available_cars
     
@@ -281,33 +518,31 @@ class CarRentalSystem:
             print("No customers are registered in the system.")
             return
         
-        print(f"\nRegistered Customers ({len(self.customers)}):")
-        print("=" * 50)
+        parts = [f"\nRegistered Customers ({len(self.customers)}):", "=" * 50]
         for customer in self.customers.values():
-            print(f"{customer}")
+            parts.append(str(customer))
             if customer.rented_cars:
-                print(f"   Currently renting {len(customer.rented_cars)} car(s)")
-        print("=" * 50)
+                parts.append(f"   Currently renting {len(customer.rented_cars)} car(s)")
+        parts.append("=" * 50)
+        sys.stdout.write("\n".join(parts) + "\n")
     
     def display_rentals(self):
         """Display all active rentals."""
-        active_rentals = {rental_id: rental for rental_id, rental in self.rentals.items() 
-                         if rental.end_time is None}
-        
+        active_rentals = list(self.iter_active_rentals())
         if not active_rentals:
             print("No active rentals in the system.")
             return
         
-        print(f"\nActive Rentals ({len(active_rentals)}):")
-        print("=" * 50)
-        for rental_id, rental in active_rentals.items():
-            print(f"Rental ID: {rental_id}")
-            print(f"Customer: {rental.customer.name}")
-            print(f"Cars: {len(rental.cars)}")
-            print(f"Start Time: {rental.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f"Rental Basis: {rental.rental_basis.name}")
-            print("-" * 30)
-        print("=" * 50)
+        parts = [f"\nActive Rentals ({len(active_rentals)}):", "=" * 50]
+        for rental in active_rentals:
+            parts.append(f"Rental ID: {rental.rental_id}")
+            parts.append(f"Customer: {rental.customer.name}")
+            parts.append(f"Cars: {len(rental.cars)}")
+            parts.append(f"Start Time: {rental.start_time_str}")
+            parts.append(f"Rental Basis: {rental.rental_basis.name}")
+            parts.append("-" * 30)
+        parts.append("=" * 50)
+        sys.stdout.write("\n".join(parts) + "\n")
     
     def find_customer(self, customer_id: str) -> Optional[Customer]:
         """Find a customer by ID.
@@ -318,10 +553,12 @@ class CarRentalSystem:
         Returns:
             Optional[Customer]: Customer object if found, None otherwise
         """
-        if customer_id in self.customers:
-            return self.customers[customer_id]
+        customer = self.customers.get(customer_id)
+        if customer is not None:
+            return customer
         
-        print(f"Customer with ID {customer_id} not found.")
+        if self.verbose:
+            print(f"Customer with ID {customer_id} not found.")
         return None
     
     def find_available_cars(self, count: int) -> List[Car]:
@@ -333,13 +570,37 @@ class CarRentalSystem:
         Returns:
             List[Car]: List of available cars up to the requested count
         """
-        available_cars = [car for car in self.inventory.values() if car.available]
-        
-        if len(available_cars) < count:
-            print(f"Only {len(available_cars)} cars are available out of {count} requested.")
+        available_positions = self._available_positions
+        if len(available_positions) < count:
+            if self.verbose:
+                print(f"Only {len(available_positions)} cars are available out of {count} requested.")
             return []
         
-        return available_cars[:count]
+        fleet = self._fleet
+        return [fleet[position] for position in islice(available_positions, count)]
+    
+    def compute_all_bills(self, as_of: datetime.datetime = None) -> Dict[str, float]:
+        """Compute bill amounts for every rental in a single pass.
+        
+        Returned rentals report their final bill. Active rentals are billed as
+        if returned at as_of, without closing them.
+        
+        Args:
+            as_of: Time used to bill active rentals. Defaults to current time.
+            
+        Returns:
+            Dict[str, float]: Bill amount keyed by rental ID
+        """
+        as_of = as_of or _now()
+        bills = {}
+        
+        for rental_id, rental in self.rentals.items():
+            if rental.end_time is not None:
+                bills[rental_id] = rental.quote(rental.end_time)
+            else:
+                bills[rental_id] = rental.quote(as_of)
+        
+        return bills
     
     def parse_datetime(self, datetime_str: str) -> datetime.datetime:
         """Parse datetime string in the format 'YYYY-MM-DD HH:MM'.
@@ -351,9 +612,10 @@ class CarRentalSystem:
             datetime.datetime: Parsed datetime object
         """
         try:
-            return datetime.datetime.strptime(datetime_str, '%Y-%m-%d %H:%M')
+            return _parse_dt(datetime_str)
         except ValueError:
-            print("Invalid datetime format. Please use YYYY-MM-DD HH:MM")
+            if self.verbose:
+                print("Invalid datetime format. Please use YYYY-MM-DD HH:MM")
             raise
     
     def rent_cars(self, customer_id: str, car_count: int, rental_basis: RentalBasis, 
@@ -379,11 +641,12 @@ class CarRentalSystem:
         
         # Generate rental ID
         self.rental_counter += 1
-        rental_id = f"R{self.rental_counter:04d}"
+        rental_id = _RENTAL_FMT(self.rental_counter)
         
         # Create rental
         rental = Rental(rental_id, customer, cars_to_rent, rental_basis, start_time)
         self.rentals[rental_id] = rental
+        self._active_rentals[rental_id] = rental
         
         # Update car status
         for car in cars_to_rent:
@@ -392,37 +655,60 @@ class CarRentalSystem:
             car.rental_basis = rental_basis
         
         # Update customer rentals
-        customer.rented_cars.extend(cars_to_rent)
+        customer.rented_cars.update({car.car_id: car for car in cars_to_rent})
         
-        basis_str = rental_basis.name.lower()
-        print(f"\nCars rented successfully on a {basis_str} basis.")
-        print(f"Rental ID: {rental_id}")
-        print(f"Start Time: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"Number of cars rented: {len(cars_to_rent)}")
+        if self.verbose:
+            basis_str = rental_basis.name.lower()
+            print(f"\nCars rented successfully on a {basis_str} basis.")
+            print(f"Rental ID: {rental_id}")
+            print(f"Start Time: {rental.start_time_str}")
+            print(f"Number of cars rented: {len(cars_to_rent)}")
         
         return rental
     
-    def return_cars(self, rental_id: str, return_time: datetime.datetime) -> Optional[Bill]:
+    def rent_cars_batch(self, requests: Iterable[Tuple[str, int, RentalBasis, datetime.datetime]]
+                        ) -> List[Optional[Rental]]:
+        """Process several rentals without printing per-rental messages.
+        
+        Args:
+            requests: (customer_id, car_count, rental_basis, start_time) tuples
+            
+        Returns:
+            List[Optional[Rental]]: Rental for each request, or None where it failed
+        """
+        with self._quiet():
+            return [self.rent_cars(*request) for request in requests]
+    
+    def return_cars(self, rental_id: str, return_time: datetime.datetime,
+                    generated_time: Optional[datetime.datetime] = None) -> Optional[Bill]:
         """Return rented cars and generate bill.
         
         Args:
             rental_id: ID of the rental to return
             return_time: Time when cars are returned
+            generated_time: Time stamped on the bill. Defaults to current time.
             
         Returns:
             Optional[Bill]: Bill object if successful, None otherwise
         """
-        if rental_id not in self.rentals:
-            print(f"Rental with ID {rental_id} not found.")
+        rental = self.rentals.get(rental_id)
+        if rental is None:
+            if self.verbose:
+                print(f"Rental with ID {rental_id} not found.")
             return None
         
-        rental = self.rentals[rental_id]
-        
         if rental.end_time is not None:
-            print(f"Rental with ID {rental_id} has already been returned.")
+            if self.verbose:
+                print(f"Rental with ID {rental_id} has already been returned.")
+            return None
+        
+        if return_time < rental.start_time:
+            if self.verbose:
+                print("Return time cannot be earlier than rental start time.")
             return None
         
         rental.end_time = return_time
+        self._active_rentals.pop(rental_id, None)
         
         # Update car status
         for car in rental.cars:
@@ -432,90 +718,119 @@ class CarRentalSystem:
         
         # Update customer rentals
         for car in rental.cars:
-            if car in rental.customer.rented_cars:
-                rental.customer.rented_cars.remove(car)
+            rental.customer.rented_cars.pop(car.car_id, None)
         
         rental.customer.rental_history.append(rental)
         
         # Generate bill
         self.bill_counter += 1
-        bill_id = f"B{self.bill_counter:04d}"
-        bill = Bill(bill_id, rental)
+        bill_id = _BILL_FMT(self.bill_counter)
+        bill = Bill(bill_id, rental, generated_time)
         self.bills[bill_id] = bill
         
-        print(f"\nCars returned successfully.")
-        print(f"Rental ID: {rental_id}")
-        print(f"End Time: {return_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"Bill ID: {bill_id}")
-        print(f"Amount: ${bill.amount:.2f}")
+        if self.verbose:
+            print(f"Rental duration: {rental.duration_units} {rental.unit_str}")
+            print(f"\nCars returned successfully.")
+            print(f"Rental ID: {rental_id}")
+            print(f"End Time: {rental.end_time_str}")
+            print(f"Bill ID: {bill_id}")
+            print(f"Amount: ${bill.amount:.2f}")
         
         return bill
+    
+    def return_cars_batch(self, rental_ids: Iterable[str],
+                          return_time: Optional[datetime.datetime] = None) -> List[Optional[Bill]]:
+        """Return several rentals at once without printing per-rental messages.
+        
+        All bills share a single timestamp, e.g. for an end-of-day close-out.
+        
+        Args:
+            rental_ids: IDs of the rentals to return
+            return_time: Time when cars are returned. Defaults to current time.
+            
+        Returns:
+            List[Optional[Bill]]: Bill for each rental, or None where it failed
+        """
+        now = _now()
+        return_time = return_time or now
+        
+        with self._quiet():
+            return [self.return_cars(rental_id, return_time, now) for rental_id in rental_ids]
 
 
 def interactive_menu():
     """Interactive menu for the car rental system."""
     car_rental_system = CarRentalSystem("Prachi's Baleno Shop")
     
+    # Local aliases for names used on every loop iteration
+    _print, _input = print, input
+    HOURLY, DAILY, WEEKLY = RentalBasis.HOURLY, RentalBasis.DAILY, RentalBasis.WEEKLY
+    
+    # The menu never changes, so render it once and write it in one call per loop
+    menu = "\n".join([
+        "\n" + "=" * 50,
+        f"Welcome to {car_rental_system.company_name}",
+        "=" * 50,
+        "1. Register New Customer",
+        "2. Rent Cars",
+        "3. Return Cars",
+        "4. View Available Cars",
+        "5. View Customers",
+        "6. View Active Rentals",
+        "7. Exit",
+        "=" * 50,
+    ]) + "\n"
+    
     while True:
-        print("\n" + "=" * 50)
-        print(f"Welcome to {car_rental_system.company_name}")
-        print("=" * 50)
-        print("1. Register New Customer")
-        print("2. Rent Cars")
-        print("3. Return Cars")
-        print("4. View Available Cars")
-        print("5. View Customers")
-        print("6. View Active Rentals")
-        print("7. Exit")
-        print("=" * 50)
-        
-        choice = input("Enter your choice (1-7): ")
+        sys.stdout.write(menu)
+        
+        choice = _input("Enter your choice (1-7): ")
         
         if choice == '1':
             # Register new customer
-            print("\n--- Register New Customer ---")
-            name = input("Enter customer name: ")
-            email = input("Enter customer email: ")
-            phone = input("Enter customer phone: ")
+            _print("\n--- Register New Customer ---")
+            name = _input("Enter customer name: ")
+            email = _input("Enter customer email: ")
+            phone = _input("Enter customer phone: ")
             
             customer = car_rental_system.register_customer(name, email, phone)
-            print(f"Customer registered successfully with ID: {customer.customer_id}")
+            _print(f"Customer registered successfully with ID: {customer.customer_id}")
         
         elif choice == '2':
             # Rent cars
-            print("\n--- Rent Cars ---")
+            _print("\n--- Rent Cars ---")
             car_rental_system.display_customers()
             
-            customer_id = input("Enter customer ID: ")
+            customer_id = _input("Enter customer ID: ")
             customer = car_rental_system.find_customer(customer_id)
             
             if not customer:
                 continue
             
             try:
-                car_count = int(input("Enter number of cars to rent: "))
+                car_count = int(_input("Enter number of cars to rent: "))
                 if car_count <= 0:
-                    print("Number of cars must be positive.")
+                    _print("Number of cars must be positive.")
                     continue
                 
-                print("\nRental Basis Options:")
-                print("1. Hourly (Rs 200.00 per hour per car)")
-                print("2. Daily (Rs 1000.00 per day per car)")
-                print("3. Weekly (Rs 4750.00 per week per car)")
+                _print("\nRental Basis Options:")
+                _print("1. Hourly (Rs 200.00 per hour per car)")
+                _print("2. Daily (Rs 1000.00 per day per car)")
+                _print("3. Weekly (Rs 4750.00 per week per car)")
                 
-                basis_choice = input("Choose rental basis (1-3): ")
+                basis_choice = _input("Choose rental basis (1-3): ")
                 
                 if basis_choice == '1':
-                    rental_basis = RentalBasis.HOURLY
+                    rental_basis = HOURLY
                 elif basis_choice == '2':
-                    rental_basis = RentalBasis.DAILY
+                    rental_basis = DAILY
                 elif basis_choice == '3':
-                    rental_basis = RentalBasis.WEEKLY
+                    rental_basis = WEEKLY
                 else:
-                    print("Invalid choice. Please try again.")
+                    _print("Invalid choice. Please try again.")
                     continue
                 
-                start_date_str = input("Enter pickup date and time (YYYY-MM-DD HH:MM): ")
+                start_date_str = _input("Enter pickup date and time (YYYY-MM-DD HH:MM): ")
                 
                 try:
                     start_time = car_rental_system.parse_datetime(start_date_str)
@@ -525,40 +840,25 @@ def interactive_menu():
                 rental = car_rental_system.rent_cars(customer_id, car_count, rental_basis, start_time)
                 
                 if rental:
-                    print(f"Cars rented successfully. Rental ID: {rental.rental_id}")
+                    _print(f"Cars rented successfully. Rental ID: {rental.rental_id}")
             
             except ValueError:
-                print("Invalid input. Please enter numeric values where required.")
+                _print("Invalid input. Please enter numeric values where required.")
         
         elif choice == '3':
             # Return cars
-            print("\n--- Return Cars ---")
+            _print("\n--- Return Cars ---")
             car_rental_system.display_rentals()
             
-            rental_id = input("Enter rental ID: ")
-            
-            if rental_id not in car_rental_system.rentals:
-                print(f"Rental with ID {rental_id} not found.")
-                continue
-            
-            rental = car_rental_system.rentals[rental_id]
-            if rental.end_time is not None:
-                print(f"Rental with ID {rental_id} has already been returned.")
-                continue
-            
-            return_date_str = input("Enter return date and time (YYYY-MM-DD HH:MM): ")
+            rental_id = _input("Enter rental ID: ")
+            return_date_str = _input("Enter return date and time (YYYY-MM-DD HH:MM): ")
             
             try:
                 return_time = car_rental_system.parse_datetime(return_date_str)
-                
-                if return_time < rental.start_time:
-                    print("Return time cannot be earlier than rental start time.")
-                    continue
-                
                 bill = car_rental_system.return_cars(rental_id, return_time)
                 
                 if bill:
-                    print(bill.generate_invoice())
+                    _print(bill.generate_invoice())
             
             except ValueError:
                 continue
@@ -577,11 +877,11 @@ def interactive_menu():
         
         elif choice == '7':
             # Exit
-            print("\nThank you for using Swift Wheels Car Rental. Goodbye!")
+            _print("\nThank you for using Swift Wheels Car Rental. Goodbye!")
             break
         
         else:
-            print("Invalid choice. Please try again.")
+            _print("Invalid choice. Please try again.")
 
 
 if __name__ == "__main__":